@@ -1,5 +1,15 @@
 import os
 import asyncio
+import functools
+import hashlib
+import logging
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+import httpx
+import orjson
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 from pipecat.pipeline.pipeline import Pipeline
 from pipecat.pipeline.task import PipelineTask, PipelineParams, PipelineTaskParams
 from pipecat.services.deepgram.stt import DeepgramSTTService
@@ -7,28 +17,219 @@ from pipecat.services.openai.llm import OpenAILLMService
 from pipecat.services.fish.tts import FishAudioTTSService
 from pipecat.processors.aggregators.openai_llm_context import OpenAILLMContext, OpenAILLMContextFrame
 from pipecat.transports.base_transport import BaseTransport, TransportParams
-from pipecat.transports.base_input import BaseInputTransport
 from pipecat.transports.base_output import BaseOutputTransport
 from pipecat.processors.frame_processor import FrameProcessor
 from pipecat.frames.frames import (
-    InputAudioRawFrame,
     OutputAudioRawFrame,
-    StartFrame,
-    EndFrame,
-    CancelFrame,
+    ControlFrame,
     TextFrame,
     TranscriptionFrame,
+    InterimTranscriptionFrame,
     LLMTextFrame,
     TTSTextFrame,
-    TranslationFrame,
     LLMFullResponseStartFrame,
     LLMFullResponseEndFrame,
     InterruptionFrame,
-    TTSAudioRawFrame,
     TTSStartedFrame,
     TTSStoppedFrame,
 )
 
+from transports import FastAPIInputTransport  # Shared with the STT-only pipeline
+
+logger = logging.getLogger(__name__)
+
+# Deepgram transcribes English unless told otherwise
+SOURCE_LANG = "en"
+
+# Language name mapping for better translation prompt
+LANG_NAMES = {
+    'es': 'Spanish',
+    'fr': 'French',
+    'de': 'German',
+    'ja': 'Japanese',
+    'zh': 'Chinese',
+    'ko': 'Korean',
+    'it': 'Italian',
+    'pt': 'Portuguese',
+    'ru': 'Russian',
+    'ar': 'Arabic',
+    'hi': 'Hindi',
+    'nl': 'Dutch',
+    'pl': 'Polish',
+    'tr': 'Turkish',
+    'vi': 'Vietnamese',
+    'th': 'Thai',
+    'sv': 'Swedish',
+    'da': 'Danish',
+    'no': 'Norwegian',
+    'fi': 'Finnish',
+    'en': 'English',
+}
+
+# LRU of sentence translations shared across sessions, keyed by
+# SHA-256 of the target language and the full source sentence
+TRANSLATION_CACHE_SIZE = 512
+_translation_cache: "OrderedDict[str, str]" = OrderedDict()
+
+
+def translation_cache_key(target_lang, text):
+    return hashlib.sha256(f"{target_lang}\0{text}".encode("utf-8")).hexdigest()
+
+
+@dataclass
+class TranslationRequestFrame(ControlFrame):
+    """
+    Sent ahead of each translation so it travels in order with the LLM output.
+    cache_key is where the response is stored; None marks a cache replay.
+    """
+    cache_key: Optional[str] = None
+
+
+@functools.lru_cache(maxsize=None)
+def require_api_key(name):
+    """
+    Look up a required API key once and reuse it for later sessions.
+    Missing keys raise (and so are not cached) so they can be added without a restart.
+    """
+    api_key = os.getenv(name)
+    if not api_key:
+        logger.error("%s not found in environment variables!", name)
+        raise ValueError(f"{name} is required")
+    return api_key
+
+
+@functools.lru_cache(maxsize=32)
+def build_system_prompt(target_lang_name):
+    """Translation system prompt, built once per target language"""
+    return f"Translate the user's speech to {target_lang_name}. Output ONLY the translation, nothing else. Be concise and natural."
+
+
+# OpenAI client shared by every session's LLM service
+_shared_openai_client = None
+
+
+class SharedClientOpenAILLMService(OpenAILLMService):
+    """
+    OpenAILLMService that reuses one AsyncOpenAI client across sessions,
+    so new connections skip client setup and reuse warm keep-alive connections.
+    """
+
+    def create_client(
+        self,
+        api_key=None,
+        base_url=None,
+        organization=None,
+        project=None,
+        default_headers=None,
+        **kwargs,
+    ):
+        global _shared_openai_client
+        if _shared_openai_client is None:
+            # HTTP/2 multiplexes concurrent sessions' requests over a few connections
+            _shared_openai_client = AsyncOpenAI(
+                api_key=api_key,
+                base_url=base_url,
+                organization=organization,
+                project=project,
+                http_client=DefaultAsyncHttpxClient(
+                    http2=True,
+                    limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+                ),
+                default_headers=default_headers,
+            )
+        return _shared_openai_client
+
+
+# Serialized {"type": "transcript", "mode": ..., "is_final": ..., "text": ...}
+# messages up to the text value, built once per (mode, is_final)
+TRANSCRIPT_ENVELOPES = {
+    (mode, is_final): orjson.dumps(
+        {"type": "transcript", "mode": mode, "is_final": is_final}
+    )[:-1] + b',"text":'
+    for mode in ("original", "translation")
+    for is_final in (True, False)
+}
+
+
+class TranscriptWriter:
+    """
+    Sends JSON messages to the WebSocket from a background task, in order,
+    so processors never wait on socket writes. An interim transcript that is
+    still queued when a newer message for the same mode arrives is dropped.
+    """
+
+    def __init__(self, websocket):
+        self._websocket = websocket
+        self._queue = asyncio.Queue()
+        self._task = None
+
+    def send(self, mode, text, is_final):
+        if self._task is None:
+            self._task = asyncio.create_task(self._write_messages())
+        self._queue.put_nowait((mode, text, is_final))
+
+    async def close(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _write_messages(self):
+        while True:
+            # Drain everything queued behind the first message
+            batch = [await self._queue.get()]
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            latest = {mode: i for i, (mode, _, _) in enumerate(batch)}
+            for i, (mode, text, is_final) in enumerate(batch):
+                if not is_final and latest[mode] != i:
+                    continue  # Superseded interim
+                # Only the text needs encoding; the rest of the envelope is fixed
+                payload = TRANSCRIPT_ENVELOPES[mode, is_final] + orjson.dumps(text) + b"}"
+                try:
+                    await self._websocket.send_text(payload.decode())
+                except Exception as e:
+                    logger.warning("[TranscriptWriter] WebSocket Error: %s", e)
+
+
+# Punctuation that ends a sentence (including full-width CJK forms)
+SENTENCE_END_PUNCTUATION = (".", "!", "?", "。", "！", "？")
+# A run of text up to sentence-ending punctuation. ASCII marks only count when
+# followed by whitespace or the end, so decimals like "3.5" are not split
+SENTENCE_PATTERN = re.compile(r".*?(?:[.!?]+(?=\s|$)|[。！？]+)", re.DOTALL)
+# Pieces this short (e.g. "Mr." or "U.S.") are never sent on their own
+MIN_SENTENCE_CHARS = 10
+
+
+def split_sentences(text):
+    """
+    Split text into sentences; an unterminated tail is kept as the last one.
+    Pieces of MIN_SENTENCE_CHARS or fewer are joined to their neighbours, so
+    abbreviations and short fragments reach the LLM with their context.
+    """
+    sentences = []
+    start = last_start = 0
+    for match in SENTENCE_PATTERN.finditer(text):
+        sentence = text[start:match.end()].strip()
+        if len(sentence) > MIN_SENTENCE_CHARS:
+            sentences.append(sentence)
+            last_start, start = start, match.end()
+    tail = text[start:].strip()
+    if tail:
+        if sentences and len(tail) <= MIN_SENTENCE_CHARS:
+            sentences[-1] = text[last_start:].strip()
+        else:
+            sentences.append(tail)
+    return sentences
+
+
+# Interim transcripts arriving within this window are collapsed into one update
+INTERIM_DEBOUNCE_SECONDS = 0.08
+
 
 class SentenceAggregator(FrameProcessor):
     """
@@ -36,106 +237,117 @@ class SentenceAggregator(FrameProcessor):
     Also handles sending 'original' transcript updates to the WebSocket.
     """
 
-    def __init__(self, websocket):
+    def __init__(self, writer):
         super().__init__()
-        self.websocket = websocket
+        self.writer = writer
         self.sentence_buffer = ""
+        # Text of the current segment already sent from an interim
+        self._emitted_text = ""
+        # Latest interim text waiting to be sent, and the timer that sends it
+        self._pending_interim = ""
+        self._interim_handle = None
+
+    def _queue_interim(self, text):
+        """
+        Send an interim update after a short delay, keeping only the latest text.
+        Interims arriving while one is pending replace it without pushing the
+        timer back, so the UI still updates during continuous speech.
+        """
+        self._pending_interim = text
+        if self._interim_handle is None:
+            self._interim_handle = asyncio.get_running_loop().call_later(
+                INTERIM_DEBOUNCE_SECONDS, self._flush_interim
+            )
+
+    def _flush_interim(self):
+        self._interim_handle = None
+        self.writer.send("original", self._pending_interim, is_final=False)
+
+    def _cancel_interim(self):
+        if self._interim_handle:
+            self._interim_handle.cancel()
+            self._interim_handle = None
+
+    async def cleanup(self):
+        self._cancel_interim()
+        await super().cleanup()
+
+    async def emit_sentence(self, frame, direction):
+        """Hand a complete sentence downstream"""
+        await self.push_frame(frame, direction)
+
+    async def emit_sentences(self, text, frame, direction):
+        """Send text to the UI as final and downstream one sentence at a time"""
+        # Supersedes any interim still waiting
+        self._cancel_interim()
+        self.writer.send("original", text, is_final=True)
+        for sentence in split_sentences(text):
+            new_frame = TranscriptionFrame(
+                text=sentence, user_id=frame.user_id, timestamp=frame.timestamp
+            )
+            await self.emit_sentence(new_frame, direction)
 
     async def process_frame(self, frame, direction):
         await super().process_frame(frame, direction)
 
-        if isinstance(frame, TranscriptionFrame):
-            is_final = getattr(frame, "speech_final", False)
+        if isinstance(frame, (TranscriptionFrame, InterimTranscriptionFrame)):
+            # STT emits finalized text as TranscriptionFrame, partials as interims
+            is_final = isinstance(frame, TranscriptionFrame)
             text = frame.text.strip()
 
-            print(
-                f"[SentenceAggregator] Received TranscriptionFrame: text='{text[:50]}...', is_final={is_final}"
+            logger.debug(
+                "[SentenceAggregator] Received %s: text='%.50s...'",
+                "final" if is_final else "interim",
+                text,
             )
 
-            if not text:
-                return
+            # Interims grow within a segment, so drop the part already
+            # sent from an earlier interim of this segment
+            if self._emitted_text and text.startswith(self._emitted_text):
+                pending = text[len(self._emitted_text):].strip()
+            else:
+                pending = text
 
             # Strategy: Accumulate text and check for natural sentence boundaries
             # Deepgram's interim results often contain complete phrases/sentences
 
-            # Check if this looks like a sentence ending (has punctuation)
-            has_punctuation = text.rstrip().endswith((".", "!", "?", "。", "！", "？"))
-
             # For interim results, we accumulate and look for sentence boundaries
             if not is_final:
                 # Update buffer with latest interim text (replace, don't append)
                 # Deepgram sends progressively longer interim results
-                self.sentence_buffer = text
-                
+                self.sentence_buffer = pending
+                if not pending:
+                    return
+
+                # Check if this looks like a sentence ending (has punctuation)
+                has_punctuation = pending.endswith(SENTENCE_END_PUNCTUATION)
+
                 # If we detect a sentence ending in interim AND have meaningful content, treat it as complete
-                # Require at least 10 characters to avoid sending fragments
-                if has_punctuation and len(self.sentence_buffer.strip()) > 10:
-                    print(f"[SentenceAggregator] Detected sentence end in interim: {self.sentence_buffer[:80]}")
-                    
-                    # Send FINAL to UI
-                    try:
-                        await self.websocket.send_json(
-                            {
-                                "type": "transcript",
-                                "mode": "original",
-                                "text": self.sentence_buffer,
-                                "is_final": True,
-                            }
-                        )
-                    except Exception as e:
-                        print(f"[SentenceAggregator] WS Error: {e}")
-
-                    # Send to LLM for translation only if substantial
-                    new_frame = TranscriptionFrame(
-                        text=self.sentence_buffer,
-                        user_id=frame.user_id,
-                        timestamp=frame.timestamp,
-                    )
-                    await self.push_frame(new_frame, direction)
+                # Require more than MIN_SENTENCE_CHARS characters to avoid sending fragments
+                if has_punctuation and len(pending) > MIN_SENTENCE_CHARS:
+                    logger.debug("[SentenceAggregator] Detected sentence end in interim: %.80s", pending)
+                    await self.emit_sentences(pending, frame, direction)
+                    self._emitted_text = text
 
                     # Clear buffer
                     self.sentence_buffer = ""
                 else:
 
                     # Still building - send interim update but don't translate yet
-                    print(f"[SentenceAggregator] Buffering interim: {self.sentence_buffer[:50]}...")
-
-                    try:
-                        await self.websocket.send_json(
-                            {
-                                "type": "transcript",
-                                "mode": "original",
-                                "text": self.sentence_buffer,
-                                "is_final": False,
-                            }
-                        )
-                    except Exception as e:
-                        print(f"[SentenceAggregator] WS Error: {e}")
-            else:
-                # speech_final=True - Deepgram detected end of speech
-                # This is the final version, send it
-                print(f"[SentenceAggregator] Speech final received: {text[:80]}")
+                    logger.debug("[SentenceAggregator] Buffering interim: %.50s...", pending)
 
-                # Send FINAL to UI
-                try:
-                    await self.websocket.send_json(
-                        {
-                            "type": "transcript",
-                            "mode": "original",
-                            "text": text,
-                            "is_final": True,
-                        }
-                    )
-                except Exception as e:
-                    print(f"[SentenceAggregator] WS Error: {e}")
+                    self._queue_interim(pending)
+            else:
+                # Deepgram finalized this segment - send whatever interims did not
+                logger.debug("[SentenceAggregator] Final received: %.80s", text)
 
-                # Send to LLM
-                new_frame = TranscriptionFrame(
-                    text=text, user_id=frame.user_id, timestamp=frame.timestamp
-                )
-                await self.push_frame(new_frame, direction)
+                if pending:
+                    await self.emit_sentences(pending, frame, direction)
+                else:
+                    self._cancel_interim()
 
-                # Clear buffer
+                # Next segment starts fresh
+                self._emitted_text = ""
                 self.sentence_buffer = ""
 
         else:
@@ -143,21 +355,41 @@ class SentenceAggregator(FrameProcessor):
             await self.push_frame(frame, direction)
 
 
+# Punctuation at which a partial translation is sent to the UI
+TRANSLATION_FLUSH_PUNCTUATION = ('.', '!', '?', ',', ';', ':', '。', '！', '？')
+
+
 class TranslationSender(FrameProcessor):
     """
     Handles sending LLM translations to the WebSocket.
     Accumulates streaming chunks into complete sentences before sending.
+    Stores each finished translation in the translation cache.
     """
 
-    def __init__(self, websocket):
+    def __init__(self, writer):
         super().__init__()
-        self.websocket = websocket
+        self.writer = writer
         self.translation_buffer = ""
         self.last_sent = ""
+        # Cache key of the response currently streaming, from TranslationRequestFrame
+        self.cache_key = None
 
     async def process_frame(self, frame, direction):
         await super().process_frame(frame, direction)
 
+        if isinstance(frame, TranslationRequestFrame):
+            # Consumed here; nothing downstream needs it
+            self.cache_key = frame.cache_key
+            return
+
+        if isinstance(frame, InterruptionFrame):
+            # The interrupted response must not be cached or finished
+            self.cache_key = None
+            self.translation_buffer = ""
+            self.last_sent = ""
+            await self.push_frame(frame, direction)
+            return
+
         try:
 
             # Only handle LLM output frames
@@ -170,7 +402,7 @@ class TranslationSender(FrameProcessor):
                     # Send more frequently for smoother updates
                     new_text_length = len(self.translation_buffer) - len(self.last_sent)
                     ends_with_space = self.translation_buffer.endswith(' ')
-                    has_punctuation = self.translation_buffer.rstrip().endswith(('.', '!', '?', ',', ';', ':', '。', '！', '？'))
+                    has_punctuation = self.translation_buffer.rstrip().endswith(TRANSLATION_FLUSH_PUNCTUATION)
                     
                     if (has_punctuation or 
                         (ends_with_space and new_text_length > 15) or  # Send at word boundaries after 15 chars
@@ -179,27 +411,23 @@ class TranslationSender(FrameProcessor):
                         # Send only the new portion
                         new_text = self.translation_buffer[len(self.last_sent):]
                         if new_text.strip():
-                            await self.websocket.send_json({
-                                "type": "transcript",
-                                "mode": "translation",
-                                "text": new_text,
-                                "is_final": True
-                            })
-                            print(f"[TranslationSender] Sent translation chunk: {new_text[:50]}...")
+                            self.writer.send("translation", new_text, is_final=True)
+                            logger.debug("[TranslationSender] Sent translation chunk: %.50s...", new_text)
                             self.last_sent = self.translation_buffer
                             
             elif isinstance(frame, LLMFullResponseEndFrame):
+                cache_key, self.cache_key = self.cache_key, None
+                if cache_key and self.translation_buffer.strip():
+                    _translation_cache[cache_key] = self.translation_buffer
+                    if len(_translation_cache) > TRANSLATION_CACHE_SIZE:
+                        _translation_cache.popitem(last=False)
+                
                 # Send any remaining buffered translation
                 if len(self.translation_buffer) > len(self.last_sent):
                     final_text = self.translation_buffer[len(self.last_sent):]
                     if final_text.strip():
-                    await self.websocket.send_json({
-                        "type": "transcript",
-                        "mode": "translation",
-                            "text": final_text,
-                        "is_final": True
-                    })
-                    print(f"[TranslationSender] Sent final translation: {final_text[:50]}...")
+                        self.writer.send("translation", final_text, is_final=True)
+                        logger.debug("[TranslationSender] Sent final translation: %.50s...", final_text)
                 
                 # Reset buffers for next translation
                 self.translation_buffer = ""
@@ -207,116 +435,138 @@ class TranslationSender(FrameProcessor):
 
 
         except Exception as e:
-            print(f"TranslationSender: Failed to send message: {e}")
+            logger.warning("[TranslationSender] Failed to send message: %s", e)
 
         await self.push_frame(frame, direction)
 
 
-class TranslationPreprocessor(FrameProcessor):
-    """Preprocesses TranscriptionFrame to ensure LLM translates it"""
+class PassthroughTranslator(FrameProcessor):
+    """
+    Used when the target language is the source language.
+    Skips the LLM and sends each sentence straight to the UI and TTS.
+    """
 
-    def __init__(self, target_lang_name):
+    def __init__(self, writer):
         super().__init__()
-        self.target_lang_name = target_lang_name
+        self.writer = writer
 
     async def process_frame(self, frame, direction):
         await super().process_frame(frame, direction)
 
         if isinstance(frame, TranscriptionFrame):
-            # Create a TextFrame with explicit translation instruction
-            # This ensures the LLM knows it needs to translate
-            translation_prompt = f"Translate to {self.target_lang_name}: {frame.text}"
-            text_frame = TextFrame(text=translation_prompt)
-            print(
-                f"[TranslationPreprocessor] Preprocessing: '{frame.text[:60]}...' -> '{translation_prompt[:60]}...'"
-            )
-            await self.push_frame(text_frame, direction)
+            self.writer.send("translation", frame.text, is_final=True)
+
+            await self.push_frame(TTSTextFrame(text=frame.text), direction)
         else:
             await self.push_frame(frame, direction)
 
 
-class ContextManager(FrameProcessor):
-
+class SentenceTranslationAggregator(SentenceAggregator):
     """
-    Manages LLM context and converts TranscriptionFrame to OpenAILLMContextFrame.
-    Resets context to just the system prompt for each user sentence to ensure
-    the LLM receives a fresh translation request every time.
+    SentenceAggregator that turns each complete sentence straight into an
+    LLM translation request, instead of going through a separate stage.
+    Each sentence gets its own context holding just the system prompt and the
+    sentence, so requests still queued for the LLM are never overwritten.
+    Sentences already in the translation cache skip the LLM.
     """
-    def __init__(self, context):
 
+    def __init__(self, writer, system_prompt, target_lang):
+        super().__init__(writer)
+        # Leads every request; the prompt is fixed per target language
+        self.system_message = {"role": "system", "content": system_prompt}
+        self.target_lang = target_lang
+
+    async def emit_sentence(self, frame, direction):
+        cache_key = translation_cache_key(self.target_lang, frame.text)
+        cached = _translation_cache.get(cache_key)
+        if cached is not None:
+            # Replay the stored translation as if the LLM produced it
+            _translation_cache.move_to_end(cache_key)
+            await self.push_frame(TranslationRequestFrame(), direction)
+            await self.push_frame(LLMFullResponseStartFrame(), direction)
+            await self.push_frame(LLMTextFrame(text=cached), direction)
+            await self.push_frame(LLMFullResponseEndFrame(), direction)
+            return
+
+        await self.push_frame(TranslationRequestFrame(cache_key=cache_key), direction)
+
+        # Fresh context per request: the LLM queues context frames, so a shared,
+        # mutated context would be overwritten before earlier requests run
+        messages = [self.system_message, {"role": "user", "content": frame.text}]
+
+        # Create context frame for the LLM
+        context_frame = OpenAILLMContextFrame(OpenAILLMContext(messages=messages))
+        await self.push_frame(context_frame, direction)
+
+
+# Punctuation at which a partial translation is handed to TTS
+TTS_FLUSH_PUNCTUATION = ('.', '!', '?', ',', ':', ';')
+
+
+class LLMToTTS(FrameProcessor):
+    """
+    Converts LLM translation output (LLMTextFrame only) to TTSTextFrame.
+    Streamed tokens are flushed to TTS at clause boundaries so speech can
+    start before the whole translation has arrived.
+    """
+    def __init__(self):
         super().__init__()
-        self.context = context
-        self.system_message = context.messages[0] if context.messages else None
+        self.accumulated_text = ""
+        self.last_tts_sent = ""
 
     async def process_frame(self, frame, direction):
         await super().process_frame(frame, direction)
 
-        
-        if isinstance(frame, TranscriptionFrame):
-            # Reset context to the original system prompt before sending to LLM
-            if self.system_message:
-                self.context.set_messages([self.system_message])
-            else:
-                self.context.set_messages([])
-
-            # Add user message to context
-            self.context.add_message({"role": "user", "content": frame.text})
-            
-            # Create context frame for the LLM
-            context_frame = OpenAILLMContextFrame(self.context)
-            await self.push_frame(context_frame, direction)
-        else:
-            # Pass through all other frames
-            await self.push_frame(frame, direction)
+        # Only accumulate LLM output chunks, NOT TranscriptionFrames
+        if isinstance(frame, LLMTextFrame):
+            self.accumulated_text += frame.text
 
+            # Check if we have enough text to send to TTS
+            # Send at natural boundaries (punctuation or word boundaries)
+            new_text = self.accumulated_text[len(self.last_tts_sent):]
 
+            # Send to TTS when we have a complete phrase or sentence
+            if (new_text.rstrip().endswith(TTS_FLUSH_PUNCTUATION) or
+                (new_text.endswith(' ') and len(new_text) > 20) or
+                len(new_text) > 40):
 
-class FastAPIInputTransport(BaseInputTransport):
-    def __init__(self, websocket, params):
-        super().__init__(params)
-        self._websocket = websocket
-        self._receive_task = None
+                if new_text.strip():
+                    tts_frame = TTSTextFrame(text=new_text.strip())
+                    logger.debug("[LLMToTTS] Sending to TTS: %.50s...", new_text.strip())
+                    await self.push_frame(tts_frame, direction)
+                    self.last_tts_sent = self.accumulated_text
 
-    async def start(self, frame: StartFrame):
-        # Call parent start to initialize
-        await super().start(frame)
-        # Start receiving audio from WebSocket
-        self._receive_task = asyncio.create_task(self._receive_audio())
+        elif isinstance(frame, LLMFullResponseEndFrame):
+            # Send any remaining text to TTS
+            final_text = self.accumulated_text[len(self.last_tts_sent):]
+            if final_text.strip():
+                tts_frame = TTSTextFrame(text=final_text.strip())
+                logger.debug("[LLMToTTS] Sending final TTS: %.50s...", final_text.strip())
+                await self.push_frame(tts_frame, direction)
 
-    async def _receive_audio(self):
-        """Receive audio bytes from WebSocket and push as frames"""
-        chunk_count = 0
-        try:
-            while True:
-                message = await self._websocket.receive_bytes()
-                chunk_count += 1
-                if chunk_count % 50 == 0:  # Log every 50 chunks to avoid spam
-                    print(
-                        f"[FastAPIInput] Received {chunk_count} audio chunks (latest: {len(message)} bytes)"
-                    )
-                if chunk_count == 1:
-                    print(
-                        f"[FastAPIInput] First audio chunk received: {len(message)} bytes"
-                    )
-                frame = InputAudioRawFrame(
-                    audio=message,
-                    sample_rate=self._params.audio_in_sample_rate,
-                    num_channels=1,
-                )
-                await self.push_frame(frame)
-        except Exception as e:
-            print(f"[FastAPIInput] WebSocket Input closed: {e}")
-            await self.push_frame(CancelFrame())
+            # Reset for next translation
+            self.accumulated_text = ""
+            self.last_tts_sent = ""
+            await self.push_frame(frame, direction)
+        else:
+            await self.push_frame(frame, direction)
 
-    async def stop(self, frame: EndFrame):
-        # Cancel the receive task
-        if self._receive_task:
-            self._receive_task.cancel()
-            try:
-                await self._receive_task
-            except asyncio.CancelledError:
-                pass
-        await super().stop(frame)
+
+# Frames the output transport drops before BaseOutputTransport sees them
+OUTPUT_SKIPPED_FRAMES = (
+    TextFrame,
+    LLMTextFrame,
+    LLMFullResponseStartFrame,
+    LLMFullResponseEndFrame,
+    InterruptionFrame,
+    TTSStartedFrame,
+    TTSStoppedFrame,
+)
+SKIP_FRAME = "skip"
+AUDIO_FRAME = "audio"
+OTHER_FRAME = "other"
+# Frame type -> kind, filled in the first time each type is seen
+_output_frame_kinds = {}
 
 
 class FastAPIOutputTransport(BaseOutputTransport):
@@ -324,37 +574,35 @@ class FastAPIOutputTransport(BaseOutputTransport):
         super().__init__(params)
         self._websocket = websocket
 
-    async def process_frame(self, frame, direction):
+    @staticmethod
+    def _classify(frame_type):
         # Filter out frames that we don't need to handle to avoid "not registered" warnings
-        if isinstance(
-            frame,
-            (
-                TextFrame,
-                LLMTextFrame,
-                LLMFullResponseStartFrame,
-                LLMFullResponseEndFrame,
-                InterruptionFrame,
-                TTSStartedFrame,
-                TTSStoppedFrame,
-            ),
-        ):
-            return
-
-        await super().process_frame(frame, direction)
+        if issubclass(frame_type, OUTPUT_SKIPPED_FRAMES):
+            return SKIP_FRAME
+        # Send TTS and other output audio (TTSAudioRawFrame is an OutputAudioRawFrame)
+        if issubclass(frame_type, OutputAudioRawFrame):
+            return AUDIO_FRAME
+        return OTHER_FRAME
 
-        # Handle TTS audio frames by converting them to output frames
-        if isinstance(frame, TTSAudioRawFrame):
-            try:
-                print(f"[Output] Sending TTS audio chunk: {len(frame.audio)} bytes")
-                await self._websocket.send_bytes(frame.audio)
-            except Exception as e:
-                print(f"[Output] WebSocket Error sending TTS audio: {e}")
-        # Send regular output audio frames to WebSocket
-        elif isinstance(frame, OutputAudioRawFrame):
+    async def process_frame(self, frame, direction):
+        # Only a handful of frame types flow through here, so classify each
+        # type once and look it up instead of walking isinstance chains
+        frame_type = type(frame)
+        kind = _output_frame_kinds.get(frame_type)
+        if kind is None:
+            kind = _output_frame_kinds[frame_type] = self._classify(frame_type)
+
+        # Audio is by far the most common frame here, so check it first
+        if kind == AUDIO_FRAME:
+            await super().process_frame(frame, direction)
+            # Sent inline: frames wait in this processor's input queue, which
+            # pipecat clears on interruption, so stale speech is never sent
             try:
                 await self._websocket.send_bytes(frame.audio)
             except Exception as e:
-                print(f"[Output] WebSocket Error: {e}")
+                logger.warning("[Output] WebSocket Error: %s", e)
+        elif kind != SKIP_FRAME:
+            await super().process_frame(frame, direction)
 
 
 class FastAPITransport(BaseTransport):
@@ -384,12 +632,9 @@ async def run_translation_bot(websocket_client, reference_id, target_lang):
     )
 
     # Deepgram STT Service
-    deepgram_api_key = os.getenv("DEEPGRAM_API_KEY")
-    if not deepgram_api_key:
-        print("[ERROR] DEEPGRAM_API_KEY not found in environment variables!")
-        raise ValueError("DEEPGRAM_API_KEY is required")
+    deepgram_api_key = require_api_key("DEEPGRAM_API_KEY")
 
-    print(f"[STT] Initializing Deepgram with API key: {deepgram_api_key[:8]}...")
+    logger.debug("[STT] Initializing Deepgram with API key: %.8s...", deepgram_api_key)
     stt = DeepgramSTTService(
         api_key=deepgram_api_key,
         sample_rate=16000,
@@ -401,157 +646,87 @@ async def run_translation_bot(websocket_client, reference_id, target_lang):
         utterance_end_ms=1000,  # Reduced to 1s for faster finalization (was 1500ms)
         punctuate=True,  # Ensure punctuation is added for sentence detection
     )
-    print("[STT] Deepgram STT Service initialized with low latency settings")
+    logger.info("[STT] Deepgram STT Service initialized with low latency settings")
     
     # OpenAI LLM Service for Translation - using gpt-4o-mini for fastest response
-    openai_api_key = os.getenv("OPENAI_API_KEY")
-    if not openai_api_key:
-        print("[ERROR] OPENAI_API_KEY not found in environment variables!")
-        raise ValueError("OPENAI_API_KEY is required")
+    openai_api_key = require_api_key("OPENAI_API_KEY")
     
-    print(f"[Translation] Initializing OpenAI with API key: {openai_api_key[:8]}...")
-    print(f"[Translation] Target language: {target_lang}")
+    logger.debug("[Translation] Initializing OpenAI with API key: %.8s...", openai_api_key)
+    logger.info("[Translation] Target language: %s", target_lang)
     
-    # Language name mapping for better translation prompt
-    lang_names = {
-        'es': 'Spanish',
-        'fr': 'French', 
-        'de': 'German',
-        'ja': 'Japanese',
-        'zh': 'Chinese',
-        'ko': 'Korean',
-        'it': 'Italian',
-        'pt': 'Portuguese',
-        'ru': 'Russian',
-        'ar': 'Arabic',
-        'hi': 'Hindi',
-        'nl': 'Dutch',
-        'pl': 'Polish',
-        'tr': 'Turkish',
-        'vi': 'Vietnamese',
-        'th': 'Thai',
-        'sv': 'Swedish',
-        'da': 'Danish',
-        'no': 'Norwegian',
-        'fi': 'Finnish',
-        'en': 'English'
-    }
-    target_lang_name = lang_names.get(target_lang.lower(), target_lang)
-    
-    # Create LLM context for translation with minimal, focused system prompt
-    llm_context = OpenAILLMContext(
-        messages=[
-            {
-                "role": "system",
-                "content": f"Translate the user's speech to {target_lang_name}. Output ONLY the translation, nothing else. Be concise and natural."
-            }
-        ]
-    )
+    target_lang_name = LANG_NAMES.get(target_lang.lower(), target_lang)
     
     llm_model = "gpt-4o-mini"
-    llm = OpenAILLMService(
+    llm = SharedClientOpenAILLMService(
         api_key=openai_api_key,
         model=llm_model,  # More capable model that follows translation instructions reliably
         params=OpenAILLMService.InputParams(
             max_completion_tokens=100,  # Limit output length for speed
+            # Route every session for this language to the same server-side
+            # prompt prefix cache (the system prompt is identical per language).
+            # Sent via extra_body: older openai clients reject it as a keyword
+            extra={"extra_body": {"prompt_cache_key": f"translate-{target_lang.lower()}"}},
         )
     )
-    print(f"[Translation] OpenAI LLM initialized with {llm_model}")
+    logger.info("[Translation] OpenAI LLM initialized with %s", llm_model)
     
 
     # Fish Audio TTS Service
-    fish_api_key = os.getenv("FISH_AUDIO_API_KEY")
-    if not fish_api_key:
-        print("[ERROR] FISH_AUDIO_API_KEY not found in environment variables!")
-        raise ValueError("FISH_AUDIO_API_KEY is required")
+    fish_api_key = require_api_key("FISH_AUDIO_API_KEY")
 
-    print(f"[TTS] Initializing Fish Audio TTS with API key: {fish_api_key[:8]}...")
-    print(f"[TTS] Using voice reference ID: {reference_id}")
+    logger.debug("[TTS] Initializing Fish Audio TTS with API key: %.8s...", fish_api_key)
+    logger.info("[TTS] Using voice reference ID: %s", reference_id)
     tts = FishAudioTTSService(
         api_key=fish_api_key,
         reference_id=reference_id,
-        sample_rate=24000,
-        # Enable latency optimization
-        latency="normal",  # Options: "normal" or "balanced" - normal is faster
+        sample_rate=24000,  # Matches audio_out_sample_rate, so no resampling
+        params=FishAudioTTSService.InputParams(
+            # Enable latency optimization
+            latency="normal",  # Options: "normal" or "balanced" - normal is faster
+            # Skip server-side text normalization; it holds back the first audio chunk
+            normalize=False,
+        ),
     )
-    print("[TTS] Fish Audio TTS Service initialized with low latency mode")
+    logger.info("[TTS] Fish Audio TTS Service initialized with low latency mode")
 
 
     # Processors
-    sentence_aggregator = SentenceAggregator(websocket_client)
-    translation_sender = TranslationSender(websocket_client)
-    context_manager = ContextManager(llm_context)
-    
-    # LLMToTTS: Convert LLM text output to TTSTextFrame for Fish Audio
-    class LLMToTTS(FrameProcessor):
-        """Converts LLM translation output (LLMTextFrame only) to TTSTextFrame"""
-        def __init__(self):
-            super().__init__()
-            self.accumulated_text = ""
-            self.last_tts_sent = ""
-            
-        async def process_frame(self, frame, direction):
-            await super().process_frame(frame, direction)
-            
-            # Only accumulate LLM output chunks, NOT TranscriptionFrames
-            if isinstance(frame, LLMTextFrame):
-                self.accumulated_text += frame.text
-                
-                # Check if we have enough text to send to TTS
-                # Send at natural boundaries (punctuation or word boundaries)
-                new_text = self.accumulated_text[len(self.last_tts_sent):]
-                
-                # Send to TTS when we have a complete phrase or sentence
-                if (new_text.rstrip().endswith(('.', '!', '?', ',', ':', ';')) or
-                    (new_text.endswith(' ') and len(new_text) > 20) or
-                    len(new_text) > 40):
-                    
-                    if new_text.strip():
-                        tts_frame = TTSTextFrame(text=new_text.strip())
-                        print(f"[LLMToTTS] Sending to TTS: {new_text.strip()[:50]}...")
-                        await self.push_frame(tts_frame, direction)
-                        self.last_tts_sent = self.accumulated_text
-                        
-            elif isinstance(frame, LLMFullResponseEndFrame):
-                # Send any remaining text to TTS
-                final_text = self.accumulated_text[len(self.last_tts_sent):]
-                if final_text.strip():
-                    tts_frame = TTSTextFrame(text=final_text.strip())
-                    print(f"[LLMToTTS] Sending final TTS: {final_text.strip()[:50]}...")
-                    await self.push_frame(tts_frame, direction)
-                
-                # Reset for next translation
-                    self.accumulated_text = ""
-                self.last_tts_sent = ""
-                await self.push_frame(frame, direction)
-            else:
-                await self.push_frame(frame, direction)
-    
+    # One writer per connection keeps transcript and translation messages in order
+    transcript_writer = TranscriptWriter(websocket_client)
+    translation_sender = TranslationSender(transcript_writer)
     llm_to_tts = LLMToTTS()
 
+    if target_lang.lower() == SOURCE_LANG:
+        # Nothing to translate - skip the LLM round trip entirely
+        logger.info("[Translation] Target matches source language, bypassing LLM")
+        sentence_aggregator = SentenceAggregator(transcript_writer)
+        translation_stages = [PassthroughTranslator(transcript_writer)]
+    else:
+        # Builds the LLM request for each sentence itself (resets context per sentence)
+        sentence_aggregator = SentenceTranslationAggregator(
+            transcript_writer, build_system_prompt(target_lang_name), target_lang.lower()
+        )
+        translation_stages = [
+            llm,                  # Translate with OpenAI gpt-4o-mini
+            translation_sender,   # Send translations to WebSocket
+            llm_to_tts,           # Convert LLM output to TTS format
+        ]
+
     pipeline = Pipeline([
         transport.input(),
         stt,                      # Speech to text
         sentence_aggregator,      # Buffer and form complete sentences
-        context_manager,          # Manage LLM context (prevent accumulation)
-        llm,                      # Translate with OpenAI gpt-4o-mini
-        translation_sender,       # Send translations to WebSocket
-        llm_to_tts,              # Convert LLM output to TTS format
+        *translation_stages,
         tts,                      # Text to speech
         transport.output(),       # Send audio back
     ])
     
-    print("[Pipeline] Translation pipeline created with components:")
-    print("  1. FastAPI Input Transport")
-    print("  2. Deepgram STT")
-    print("  3. Sentence Aggregator (sends original transcript)")
-    print("  4. Context Manager (prevents accumulation)")
-    print("  5. OpenAI LLM (gpt-5-nano translation - fastest)")
-    print("  6. Translation Sender (sends translated text)")
-    print("  7. LLM to TTS Converter")
-
-    print("  8. Fish Audio TTS")
-    print("  9. FastAPI Output Transport")
+    logger.info(
+        "[Pipeline] Translation pipeline created with components: "
+        "FastAPI Input Transport -> Deepgram STT -> Sentence Aggregator -> "
+        "OpenAI LLM (gpt-4o-mini) -> Translation Sender -> LLM to TTS -> "
+        "Fish Audio TTS -> FastAPI Output Transport"
+    )
 
     task = PipelineTask(
         pipeline,
@@ -562,4 +737,7 @@ async def run_translation_bot(websocket_client, reference_id, target_lang):
         ),
     )
 
-    await task.run(PipelineTaskParams(loop=asyncio.get_running_loop()))
+    try:
+        await task.run(PipelineTaskParams(loop=asyncio.get_running_loop()))
+    finally:
+        await transcript_writer.close()
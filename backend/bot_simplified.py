@@ -5,106 +5,115 @@ Translation and TTS are handled on the frontend for better performance.
 
 import os
 import asyncio
+import logging
+import orjson
 from pipecat.pipeline.pipeline import Pipeline
 from pipecat.pipeline.task import PipelineTask, PipelineParams, PipelineTaskParams
 from pipecat.services.deepgram.stt import DeepgramSTTService
 from pipecat.transports.base_transport import BaseTransport, TransportParams
-from pipecat.transports.base_input import BaseInputTransport
 from pipecat.transports.base_output import BaseOutputTransport
 from pipecat.processors.frame_processor import FrameProcessor
 from pipecat.frames.frames import (
-    InputAudioRawFrame, StartFrame, EndFrame, CancelFrame, 
-    TranscriptionFrame
+    StartFrame, EndFrame, CancelFrame,
+    TranscriptionFrame, InterimTranscriptionFrame
 )
 
+from transports import FastAPIInputTransport
+
+logger = logging.getLogger(__name__)
+
+# Serialized {"type": "transcript", "is_final": ..., "language": ..., "text": ...}
+# messages up to the text value, built once per is_final value
+TRANSCRIPT_ENVELOPES = {
+    is_final: orjson.dumps(
+        {"type": "transcript", "is_final": is_final, "language": "en"}  # Source language
+    )[:-1] + b',"text":'
+    for is_final in (True, False)
+}
+
 class TranscriptSender(FrameProcessor):
     """
     Sends transcripts directly to the WebSocket for frontend processing.
     The frontend will handle translation and TTS.
     """
+    # Interim updates are sent at most this often (~5 Hz); finals always go out
+    INTERIM_MIN_INTERVAL = 0.2
+
     def __init__(self, websocket):
         super().__init__()
         self.websocket = websocket
         self.last_transcript = ""
-        
+        self._last_interim_time = 0.0
+        # Latest held-back interim, the timer that sends it, and that send's task
+        self._pending_interim = ""
+        self._interim_handle = None
+        self._interim_task = None
+
+    async def _send(self, text, is_final):
+        logger.debug("[TranscriptSender] Sending %s: %.80s...", "final" if is_final else "interim", text)
+        try:
+            # Only the text needs encoding; the rest of the envelope is fixed
+            payload = TRANSCRIPT_ENVELOPES[is_final] + orjson.dumps(text) + b"}"
+            await self.websocket.send_text(payload.decode())
+        except Exception as e:
+            logger.warning("[TranscriptSender] Error sending transcript: %s", e)
+
+    def _flush_interim(self):
+        """Trailing edge of the throttle: send the last interim that was held back"""
+        self._interim_handle = None
+        self._last_interim_time = asyncio.get_running_loop().time()
+        self._interim_task = asyncio.create_task(self._send(self._pending_interim, False))
+
+    def _cancel_interim(self):
+        if self._interim_handle:
+            self._interim_handle.cancel()
+            self._interim_handle = None
+
+    async def _wait_interim_task(self):
+        # Keeps an interim sent by the timer ahead of anything sent after it
+        if self._interim_task:
+            await self._interim_task
+            self._interim_task = None
+
+    async def cleanup(self):
+        self._cancel_interim()
+        await super().cleanup()
+
     async def process_frame(self, frame, direction):
         await super().process_frame(frame, direction)
         
-        if isinstance(frame, TranscriptionFrame):
-            is_final = getattr(frame, 'speech_final', False)
+        if isinstance(frame, (TranscriptionFrame, InterimTranscriptionFrame)):
+            # STT emits finalized text as TranscriptionFrame, partials as interims
+            is_final = isinstance(frame, TranscriptionFrame)
             text = frame.text.strip()
             
             if not text:
                 await self.push_frame(frame, direction)
                 return
 
-            # Only send if text has changed or is final
-            if text != self.last_transcript or is_final:
-                print(f"[TranscriptSender] Sending {'final' if is_final else 'interim'}: {text[:80]}...")
-                
-                try:
-                    await self.websocket.send_json({
-                        "type": "transcript",
-                        "text": text,
-                        "is_final": is_final,
-                        "language": "en"  # Source language
-                    })
-                    
-                    if is_final:
-                        self.last_transcript = ""
-                    else:
-                        self.last_transcript = text
-                        
-                except Exception as e:
-                    print(f"[TranscriptSender] Error sending transcript: {e}")
+            if is_final:
+                # Finals go out immediately and replace any held-back interim
+                self._cancel_interim()
+                await self._wait_interim_task()
+                self.last_transcript = ""
+                await self._send(text, True)
+            elif text != self.last_transcript:
+                self.last_transcript = text
+                loop = asyncio.get_running_loop()
+                wait = self._last_interim_time + self.INTERIM_MIN_INTERVAL - loop.time()
+                if wait <= 0 and self._interim_handle is None:
+                    await self._wait_interim_task()
+                    self._last_interim_time = loop.time()
+                    await self._send(text, False)
+                else:
+                    # Too soon - hold it, so the last interim before a pause still goes out
+                    self._pending_interim = text
+                    if self._interim_handle is None:
+                        self._interim_handle = loop.call_later(wait, self._flush_interim)
         
         await self.push_frame(frame, direction)
 
 
-class FastAPIInputTransport(BaseInputTransport):
-    """Receives audio from WebSocket"""
-    def __init__(self, websocket, params):
-        super().__init__(params)
-        self._websocket = websocket
-        self._receive_task = None
-
-    async def start(self, frame: StartFrame):
-        await super().start(frame)
-        self._receive_task = asyncio.create_task(self._receive_audio())
-
-    async def _receive_audio(self):
-        """Receive audio bytes from WebSocket and push as frames"""
-        chunk_count = 0
-        try:
-            while True:
-                message = await self._websocket.receive_bytes()
-                chunk_count += 1
-                
-                if chunk_count == 1:
-                    print(f"[Input] First audio chunk received: {len(message)} bytes")
-                elif chunk_count % 100 == 0:
-                    print(f"[Input] Received {chunk_count} audio chunks")
-                
-                frame = InputAudioRawFrame(
-                    audio=message, 
-                    sample_rate=self._params.audio_in_sample_rate, 
-                    num_channels=1
-                )
-                await self.push_frame(frame)
-        except Exception as e:
-            print(f"[Input] WebSocket closed: {e}")
-            await self.push_frame(CancelFrame())
-
-    async def stop(self, frame: EndFrame):
-        if self._receive_task:
-            self._receive_task.cancel()
-            try:
-                await self._receive_task
-            except asyncio.CancelledError:
-                pass
-        await super().stop(frame)
-
-
 class FastAPIOutputTransport(BaseOutputTransport):
     """Minimal output transport - we don't send audio back anymore"""
     def __init__(self, websocket, params):
@@ -138,10 +147,7 @@ async def run_stt_pipeline(websocket_client):
     Frontend handles translation and TTS for better performance.
     """
     
-    print("\n" + "="*60)
-    print("[Pipeline] Starting simplified STT-only pipeline")
-    print("[Pipeline] Translation and TTS will be handled by frontend")
-    print("="*60 + "\n")
+    logger.info("[Pipeline] Starting simplified STT-only pipeline (translation and TTS handled by frontend)")
     
     # Create transport
     transport = SimpleTransport(
@@ -155,10 +161,10 @@ async def run_stt_pipeline(websocket_client):
     # Initialize Deepgram STT
     deepgram_api_key = os.getenv("DEEPGRAM_API_KEY")
     if not deepgram_api_key:
-        print("[ERROR] DEEPGRAM_API_KEY not found in environment variables!")
+        logger.error("DEEPGRAM_API_KEY not found in environment variables!")
         raise ValueError("DEEPGRAM_API_KEY is required")
     
-    print(f"[STT] Initializing Deepgram with API key: {deepgram_api_key[:8]}...")
+    logger.debug("[STT] Initializing Deepgram with API key: %.8s...", deepgram_api_key)
     
     stt = DeepgramSTTService(
         api_key=deepgram_api_key,
@@ -173,7 +179,7 @@ async def run_stt_pipeline(websocket_client):
         model="nova-2",             # Latest Deepgram model
     )
     
-    print("[STT] Deepgram STT Service initialized successfully")
+    logger.info("[STT] Deepgram STT Service initialized successfully")
 
     # Create transcript sender
     transcript_sender = TranscriptSender(websocket_client)
@@ -186,13 +192,10 @@ async def run_stt_pipeline(websocket_client):
         transport.output(),    # Minimal output handling
     ])
     
-    print("\n[Pipeline] Components:")
-    print("  1. WebSocket Audio Input")
-    print("  2. Deepgram Speech-to-Text") 
-    print("  3. Transcript Sender (to frontend)")
-    print("  4. Frontend handles translation (Google Translate)")
-    print("  5. Frontend handles TTS (Web Speech API)")
-    print("\n[Pipeline] Ready to process audio\n")
+    logger.info(
+        "[Pipeline] Ready to process audio: WebSocket Audio Input -> "
+        "Deepgram Speech-to-Text -> Transcript Sender (to frontend)"
+    )
 
     # Create and run pipeline task
     task = PipelineTask(
@@ -1,7 +1,20 @@
 import os
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, File, UploadFile, Form, HTTPException
+import asyncio
+import atexit
+import hashlib
+import logging
+import logging.handlers
+import queue
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import List
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, File, UploadFile, Form, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+import httpx
+import orjson
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 
 from bot_simplified import run_stt_pipeline  # Simplified STT-only pipeline
 from voice_manager import get_voice_manager
@@ -10,10 +23,81 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
-# Initialize OpenAI client
-openai_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
-app = FastAPI(title="Live Translation Backend")
+def setup_logging():
+    """
+    Route all log records through a queue to a background thread, so writing
+    to stdout never blocks the event loop. Level comes from LOG_LEVEL (default INFO).
+    """
+    root = logging.getLogger()
+    # server.py is imported twice under `python server.py` (as __main__ and as server)
+    if any(isinstance(h, logging.handlers.QueueHandler) for h in root.handlers):
+        return
+
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+    listener.start()
+    atexit.register(listener.stop)
+
+
+setup_logging()
+logger = logging.getLogger(__name__)
+
+# Initialize OpenAI client (async so requests don't block the event loop)
+# HTTP/2 lets concurrent requests share one multiplexed connection
+openai_client = AsyncOpenAI(
+    api_key=os.getenv("OPENAI_API_KEY"),
+    http_client=DefaultAsyncHttpxClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+    ),
+)
+
+# LRU cache of summaries keyed by SHA-256 of the full transcript text
+SUMMARY_CACHE_SIZE = 128
+_summary_cache: "OrderedDict[str, dict]" = OrderedDict()
+
+# Voice clone upload validation
+SUPPORTED_AUDIO_TYPES = frozenset({'audio/wav', 'audio/wave', 'audio/x-wav', 'audio/mpeg', 'audio/mp3'})
+# Rough estimate: 16kHz, 16-bit, mono = 32KB/sec, 5 seconds minimum
+MIN_CLONE_AUDIO_BYTES = 32000 * 5
+
+SUMMARY_SYSTEM_PROMPT = "You are an expert at analyzing transcripts and extracting key insights, important points, and action items. Always respond with valid JSON."
+
+# Startup warm-up must not hold up the server if OpenAI is slow to answer
+WARM_UP_TIMEOUT_SECONDS = 5
+
+
+async def warm_up():
+    """
+    Pay one-time setup costs at boot instead of on the first request:
+    load the voice model store and open the OpenAI connection pool.
+    """
+    try:
+        get_voice_manager()
+    except Exception as e:
+        logger.warning("[Startup] Voice manager warm-up skipped: %s", e)
+
+    try:
+        await asyncio.wait_for(openai_client.models.list(), timeout=WARM_UP_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        logger.warning("[Startup] OpenAI warm-up timed out after %ss", WARM_UP_TIMEOUT_SECONDS)
+    except Exception as e:
+        logger.warning("[Startup] OpenAI warm-up failed: %s", e)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await warm_up()
+    yield
+
+
+app = FastAPI(title="Live Translation Backend", default_response_class=ORJSONResponse, lifespan=lifespan)
 
 # Enable CORS for Chrome Extension
 app.add_middleware(
@@ -24,22 +108,61 @@ app.add_middleware(
 )
 
 
+class SummarizeRequest(BaseModel):
+    transcripts: List[str]
+
+
+def etag_matches(if_none_match, etag) -> bool:
+    """
+    Weak comparison of an If-None-Match header against an ETag, as GET
+    revalidation requires: "*" matches anything, W/ prefixes are ignored,
+    and any entry of a comma-separated list may match.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
+
+
+def conditional_json_response(request: Request, content) -> Response:
+    """
+    Build a JSON response with a content-hash ETag.
+    Returns 304 Not Modified when the client's If-None-Match matches.
+    """
+    response = ORJSONResponse(content=content)
+    etag = f'"{hashlib.md5(response.body).hexdigest()}"'
+    # Voice models change, so let clients cache but always revalidate
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+    return response
+
+
+# Health check payload never changes, so serialize it once
+HEALTH_RESPONSE_BODY = orjson.dumps({
+    "status": "running",
+    "service": "Live Translation Backend (STT Only)",
+    "version": "2.0",
+    "info": "Translation and TTS handled by frontend for better performance",
+    "endpoints": {
+        "websocket": "/ws/translate/{target_lang}",
+        "voice_clone": "/api/clone-voice",
+        "voice_models": "/api/voice-models"
+    }
+})
+
+
 @app.get("/")
 async def root():
     """Health check endpoint"""
-    return {
-        "status": "running",
-        "service": "Live Translation Backend (STT Only)",
-        "version": "2.0",
-        "info": "Translation and TTS handled by frontend for better performance",
-        "endpoints": {
-            "websocket": "/ws/translate/{target_lang}",
-
-            "voice_clone": "/api/clone-voice",
-            "voice_models": "/api/voice-models"
-        }
-
-    }
+    return Response(content=HEALTH_RESPONSE_BODY, media_type="application/json")
 
 
 @app.post("/api/summarize")
@@ -52,10 +175,16 @@ async def summarize_transcripts(request: SummarizeRequest):
         full_text = "\n".join(request.transcripts)
 
         if not full_text.strip():
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=400, content={"error": "No transcripts provided"}
             )
 
+        cache_key = hashlib.sha256(full_text.encode("utf-8")).hexdigest()
+        cached = _summary_cache.get(cache_key)
+        if cached is not None:
+            _summary_cache.move_to_end(cache_key)
+            return cached
+
         # Create prompt for summarization
         prompt = f"""Analyze the following transcript and create a comprehensive summary with key insightful points.
 
@@ -75,12 +204,12 @@ Format your response as JSON with the following structure:
 }}"""
 
         # Call OpenAI API
-        response = openai_client.chat.completions.create(
+        response = await openai_client.chat.completions.create(
             model="gpt-4o-mini",
             messages=[
                 {
                     "role": "system",
-                    "content": "You are an expert at analyzing transcripts and extracting key insights, important points, and action items. Always respond with valid JSON.",
+                    "content": SUMMARY_SYSTEM_PROMPT,
                 },
                 {"role": "user", "content": prompt},
             ],
@@ -92,18 +221,20 @@ Format your response as JSON with the following structure:
         summary_text = response.choices[0].message.content
 
         # Try to parse as JSON, if it fails return as text
-        import json
-
         try:
-            summary_data = json.loads(summary_text)
-            return summary_data
-        except json.JSONDecodeError:
+            summary_data = orjson.loads(summary_text)
+        except orjson.JSONDecodeError:
             # If not valid JSON, return as structured text
-            return {"summary": summary_text, "keyPoints": [], "actionItems": []}
+            summary_data = {"summary": summary_text, "keyPoints": [], "actionItems": []}
+
+        _summary_cache[cache_key] = summary_data
+        if len(_summary_cache) > SUMMARY_CACHE_SIZE:
+            _summary_cache.popitem(last=False)
+        return summary_data
 
     except Exception as e:
-        print(f"[Summarize] Error: {e}")
-        return JSONResponse(
+        logger.exception("[Summarize] Error: %s", e)
+        return ORJSONResponse(
             status_code=500, content={"error": f"Failed to generate summary: {str(e)}"}
         )
 
@@ -122,30 +253,26 @@ async def websocket_endpoint(websocket: WebSocket, target_lang: str):
     await websocket.accept()
     
 
-    print(f"\n{'='*60}")
-    print(f"[WebSocket] New connection established")
-    print(f"[WebSocket] Target Language: {target_lang}")
-    print(f"[WebSocket] Mode: STT Only (Frontend Translation)")
-    print(f"{'='*60}\n")
+    logger.info(
+        "[WebSocket] New connection established (target language: %s, mode: STT only)",
+        target_lang,
+    )
 
     try:
         # Send target language to frontend
-        await websocket.send_json({
+        await websocket.send_text(orjson.dumps({
             "type": "config",
             "target_language": target_lang,
             "source_language": "en"
-        })
+        }).decode())
         
         # Run simplified STT-only pipeline
         await run_stt_pipeline(websocket)
         
     except WebSocketDisconnect:
-        print(f"[WebSocket] Client disconnected")
+        logger.info("[WebSocket] Client disconnected")
     except Exception as e:
-        print(f"[WebSocket] Error: {e}")
-        import traceback
-
-        traceback.print_exc()
+        logger.exception("[WebSocket] Error: %s", e)
 
         try:
             await websocket.close()
@@ -170,12 +297,13 @@ async def clone_voice(
         Voice model information including model_id
     """
     try:
-        print(f"\n{'='*60}")
-        print(f"[Voice Clone] Received request for URL: {url}")
-        print(f"[Voice Clone] Audio file: {audio.filename}, content_type: {audio.content_type}")
+        logger.info("[Voice Clone] Received request for URL: %s", url)
+        logger.info(
+            "[Voice Clone] Audio file: %s, content_type: %s", audio.filename, audio.content_type
+        )
         
         # Validate audio file type
-        if audio.content_type not in ['audio/wav', 'audio/wave', 'audio/x-wav', 'audio/mpeg', 'audio/mp3']:
+        if audio.content_type not in SUPPORTED_AUDIO_TYPES:
             raise HTTPException(
                 status_code=400,
                 detail=f"Unsupported audio format: {audio.content_type}. Please use WAV or MP3."
@@ -183,11 +311,10 @@ async def clone_voice(
         
         # Read audio data
         audio_data = await audio.read()
-        print(f"[Voice Clone] Audio data size: {len(audio_data)} bytes")
+        logger.info("[Voice Clone] Audio data size: %d bytes", len(audio_data))
         
-        # Validate minimum audio length (rough estimate: 16kHz, 16-bit, mono = 32KB/sec)
-        min_size = 32000 * 5  # 5 seconds minimum
-        if len(audio_data) < min_size:
+        # Validate minimum audio length
+        if len(audio_data) < MIN_CLONE_AUDIO_BYTES:
             raise HTTPException(
                 status_code=400,
                 detail="Audio too short. Minimum 5 seconds required for voice cloning."
@@ -201,10 +328,9 @@ async def clone_voice(
             title=title
         )
         
-        print(f"[Voice Clone] Successfully created model: {result['model_id']}")
-        print(f"{'='*60}\n")
+        logger.info("[Voice Clone] Successfully created model: %s", result["model_id"])
         
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "status": "success",
             "data": result
         })
@@ -212,13 +338,11 @@ async def clone_voice(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[Voice Clone] Error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("[Voice Clone] Error: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/voice-models")
-async def list_voice_models():
+async def list_voice_models(request: Request):
     """
     List all stored voice models.
     
@@ -229,17 +353,17 @@ async def list_voice_models():
         voice_manager = get_voice_manager()
         models = voice_manager.list_voice_models()
         
-        return JSONResponse(content={
+        return conditional_json_response(request, {
             "status": "success",
             "data": models
         })
         
     except Exception as e:
-        print(f"[Voice Models] Error: {e}")
+        logger.error("[Voice Models] Error: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/voice-models/{url:path}")
-async def get_voice_model(url: str):
+async def get_voice_model(url: str, request: Request):
     """
     Get voice model for a specific URL.
     
@@ -256,7 +380,7 @@ async def get_voice_model(url: str):
         if model is None:
             raise HTTPException(status_code=404, detail="Voice model not found for this URL")
         
-        return JSONResponse(content={
+        return conditional_json_response(request, {
             "status": "success",
             "data": model
         })
@@ -264,7 +388,7 @@ async def get_voice_model(url: str):
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[Voice Model] Error: {e}")
+        logger.error("[Voice Model] Error: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.delete("/api/voice-models/{url:path}")
@@ -285,7 +409,7 @@ async def delete_voice_model(url: str):
         if not deleted:
             raise HTTPException(status_code=404, detail="Voice model not found for this URL")
         
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "status": "success",
             "message": "Voice model deleted"
         })
@@ -293,7 +417,22 @@ async def delete_voice_model(url: str):
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[Voice Model Delete] Error: {e}")
+        logger.error("[Voice Model Delete] Error: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # Auto-reload is for development only; it adds a file watcher and a
+    # supervisor process. A single worker is used because voice model
+    # mappings are held in process memory (see voice_manager.py).
+    uvicorn.run(
+        "server:app",
+        host=os.getenv("HOST", "127.0.0.1"),
+        port=int(os.getenv("PORT", "8000")),
+        reload=os.getenv("ENV", "").lower() == "dev",
+        # Audio is binary PCM that doesn't compress; skip deflate on every frame
+        ws_per_message_deflate=False,
+    )
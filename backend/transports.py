@@ -0,0 +1,105 @@
+"""
+WebSocket transport pieces shared by the translation and STT-only pipelines.
+"""
+
+import asyncio
+import logging
+from fastapi import WebSocketDisconnect
+from pipecat.transports.base_input import BaseInputTransport
+from pipecat.frames.frames import InputAudioRawFrame, StartFrame, EndFrame, CancelFrame
+
+logger = logging.getLogger(__name__)
+
+# Seconds between input transport progress logs
+STATS_LOG_INTERVAL = 1.0
+
+
+class FastAPIInputTransport(BaseInputTransport):
+    """Receives audio from WebSocket"""
+    # Small messages are coalesced into frames of at least this much audio
+    MIN_FRAME_MS = 100
+
+    def __init__(self, websocket, params):
+        super().__init__(params)
+        self._websocket = websocket
+        self._receive_task = None
+        self._stats_task = None
+        # Read by the stats task, so per-chunk work is just an increment
+        self._chunk_count = 0
+
+    async def start(self, frame: StartFrame):
+        # Call parent start to initialize
+        await super().start(frame)
+        self._receive_task = asyncio.create_task(self._receive_audio())
+        self._stats_task = asyncio.create_task(self._log_stats())
+
+    async def _receive_audio(self):
+        """Receive audio bytes from WebSocket and push them into the pipeline as frames"""
+        # Coalesce small messages into frames of at least MIN_FRAME_MS of 16-bit mono
+        # audio; larger messages (e.g. the extension's 256ms chunks) pass straight through
+        # Sample rate is fixed for the session, so read it once
+        sample_rate = self._params.audio_in_sample_rate
+        min_frame_bytes = sample_rate * 2 * self.MIN_FRAME_MS // 1000
+        buffer = bytearray()
+        first_chunk = True
+        # Read raw ASGI messages rather than going through receive_bytes()
+        # and its state checks on every chunk
+        receive = self._websocket.receive
+        push_frame = self.push_frame
+        try:
+            while True:
+                message = await receive()
+                if message["type"] == "websocket.disconnect":
+                    raise WebSocketDisconnect(message.get("code", 1000))
+                message = message.get("bytes")
+                if message is None:
+                    continue  # Text messages carry no audio
+                self._chunk_count += 1
+                if first_chunk:
+                    logger.info("[FastAPIInput] First audio chunk received: %d bytes", len(message))
+                    first_chunk = False
+
+                if buffer or len(message) < min_frame_bytes:
+                    buffer.extend(message)
+                    if len(buffer) < min_frame_bytes:
+                        continue
+                    message = bytes(buffer)
+                    buffer.clear()
+
+                # push_frame only queues the frame for the next processor, so
+                # this never waits on STT and the next read starts right away
+                await push_frame(InputAudioRawFrame(audio=message, sample_rate=sample_rate, num_channels=1))
+        except Exception as e:
+            logger.info("[FastAPIInput] WebSocket Input closed: %s", e)
+            await self.push_frame(CancelFrame())
+
+    async def _log_stats(self):
+        """Log receive progress once a second instead of from the audio loop"""
+        last_count = 0
+        while True:
+            await asyncio.sleep(STATS_LOG_INTERVAL)
+            if self._chunk_count != last_count:
+                last_count = self._chunk_count
+                logger.debug("[FastAPIInput] Received %d audio chunks", last_count)
+
+    async def stop(self, frame: EndFrame):
+        await self._cancel_tasks()
+        await super().stop(frame)
+
+    async def cancel(self, frame: CancelFrame):
+        await self._cancel_tasks()
+        await super().cancel(frame)
+
+    async def _cancel_tasks(self):
+        """Cancel the receive and stats tasks"""
+        tasks = (self._receive_task, self._stats_task)
+        self._receive_task = self._stats_task = None
+        current = asyncio.current_task()
+        for task in tasks:
+            # The receive task may be the one that cancelled the pipeline
+            if task and task is not current:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
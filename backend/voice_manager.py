@@ -5,14 +5,19 @@ Handles Fish Audio voice model creation, storage, and retrieval.
 
 import os
 import json
-import tempfile
+import asyncio
+import hashlib
+import logging
 from pathlib import Path
+from urllib.parse import urlparse
 from typing import Optional, Dict, List
 from fish_audio_sdk import Session
 from dotenv import load_dotenv
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 # Storage file for voice model mappings
 VOICE_MODELS_FILE = Path(__file__).parent / "voice_models.json"
 
@@ -26,6 +31,8 @@ class VoiceManager:
             raise ValueError("FISH_AUDIO_API_KEY not found in environment variables")
         
         self.session = Session(self.api_key)
+        # Cached result of list_voice_models, rebuilt after any change
+        self._models_list: Optional[List[Dict[str, str]]] = None
         self._load_models()
     
     def _load_models(self) -> None:
@@ -35,12 +42,12 @@ class VoiceManager:
                 with open(VOICE_MODELS_FILE, 'r') as f:
                     self.models = json.load(f)
             except (json.JSONDecodeError, ValueError) as e:
-                print(f"[VoiceManager] Warning: Corrupted voice_models.json file: {e}")
-                print(f"[VoiceManager] Starting with empty models database")
+                logger.warning("[VoiceManager] Corrupted voice_models.json file: %s", e)
+                logger.warning("[VoiceManager] Starting with empty models database")
                 # Backup the corrupted file
                 backup_path = VOICE_MODELS_FILE.with_suffix('.json.backup')
                 VOICE_MODELS_FILE.rename(backup_path)
-                print(f"[VoiceManager] Corrupted file backed up to: {backup_path}")
+                logger.warning("[VoiceManager] Corrupted file backed up to: %s", backup_path)
                 self.models = {}
         else:
             self.models = {}
@@ -49,6 +56,19 @@ class VoiceManager:
         """Save voice model mappings to storage file"""
         with open(VOICE_MODELS_FILE, 'w') as f:
             json.dump(self.models, f, indent=2)
+        self._models_list = None
+    
+    @staticmethod
+    def _public_info(info: Dict[str, str]) -> Dict[str, str]:
+        """Model info without internal fields (the audio hash is only for dedupe)"""
+        return {key: value for key, value in info.items() if key != "audio_sha256"}
+    
+    def _find_model_by_hash(self, audio_sha256: str) -> Optional[Dict[str, str]]:
+        """Find a stored model that was created from identical audio"""
+        for info in self.models.values():
+            if info.get("audio_sha256") == audio_sha256:
+                return info
+        return None
     
     async def create_voice_model(
         self, 
@@ -68,63 +88,68 @@ class VoiceManager:
             Dict with model_id, title, and url
         """
         # Extract hostname from URL for cleaner naming
-        from urllib.parse import urlparse
         hostname = urlparse(url).netloc or "unknown"
         
         # Generate title if not provided
         if not title:
             title = f"Cloned Voice - {hostname}"
         
-        # Create a temporary file for the audio
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_file:
-            tmp_file.write(audio_data)
-            tmp_path = tmp_file.name
-        
-        try:
-            # Create the voice model using Fish Audio SDK
-            print(f"[VoiceManager] Creating voice model: {title}")
-            
-            with open(tmp_path, 'rb') as audio_file:
-                model = self.session.create_model(
-                    title=title,
-                    voices=[audio_file.read()],
-                    description=f"Voice cloned from {hostname}",
-                    visibility="private",  # Keep models private
-                    # enhance_audio_quality=True,  # Optional: Enable for better quality
-                )
-            
-            model_id = model.id
-            print(f"[VoiceManager] Voice model created: {model_id}")
-            
-            # Store the model mapping
-            # Convert datetime to ISO format string for JSON serialization
-            created_at = None
-            if hasattr(model, 'created_at') and model.created_at:
-                if isinstance(model.created_at, str):
-                    created_at = model.created_at
-                else:
-                    # Convert datetime to ISO format string
-                    created_at = model.created_at.isoformat()
-            
-            self.models[url] = {
-                "model_id": model_id,
-                "title": title,
-                "hostname": hostname,
-                "created_at": created_at
-            }
+        # Reuse an existing model if this exact audio was already cloned
+        audio_sha256 = hashlib.sha256(audio_data).hexdigest()
+        existing = self._find_model_by_hash(audio_sha256)
+        if existing:
+            logger.info("[VoiceManager] Reusing voice model for identical audio: %s", existing["model_id"])
+            self.models[url] = {**existing, "title": title, "hostname": hostname}
             self._save_models()
-            
             return {
-                "model_id": model_id,
+                "model_id": existing["model_id"],
                 "title": title,
                 "url": url,
                 "hostname": hostname
             }
-            
-        finally:
-            # Clean up temporary file
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
+        
+        # Create the voice model using Fish Audio SDK
+        # The SDK call is blocking, so run it off the event loop
+        logger.info("[VoiceManager] Creating voice model: %s", title)
+        
+        # The upload is already in memory, so pass the bytes straight through
+        model = await asyncio.to_thread(
+            self.session.create_model,
+            title=title,
+            voices=[audio_data],
+            description=f"Voice cloned from {hostname}",
+            visibility="private",  # Keep models private
+            # enhance_audio_quality=True,  # Optional: Enable for better quality
+        )
+        
+        model_id = model.id
+        logger.info("[VoiceManager] Voice model created: %s", model_id)
+        
+        # Store the model mapping
+        # Convert datetime to ISO format string for JSON serialization
+        created_at = None
+        if hasattr(model, 'created_at') and model.created_at:
+            if isinstance(model.created_at, str):
+                created_at = model.created_at
+            else:
+                # Convert datetime to ISO format string
+                created_at = model.created_at.isoformat()
+        
+        self.models[url] = {
+            "model_id": model_id,
+            "title": title,
+            "hostname": hostname,
+            "created_at": created_at,
+            "audio_sha256": audio_sha256
+        }
+        self._save_models()
+        
+        return {
+            "model_id": model_id,
+            "title": title,
+            "url": url,
+            "hostname": hostname
+        }
     
     def get_voice_model(self, url: str) -> Optional[Dict[str, str]]:
         """
@@ -136,7 +161,8 @@ class VoiceManager:
         Returns:
             Dict with model info or None if not found
         """
-        return self.models.get(url)
+        info = self.models.get(url)
+        return self._public_info(info) if info is not None else None
     
     def list_voice_models(self) -> List[Dict[str, str]]:
         """
@@ -145,13 +171,15 @@ class VoiceManager:
         Returns:
             List of model info dicts
         """
-        return [
-            {
-                "url": url,
-                **info
-            }
-            for url, info in self.models.items()
-        ]
+        if self._models_list is None:
+            self._models_list = [
+                {
+                    "url": url,
+                    **self._public_info(info)
+                }
+                for url, info in self.models.items()
+            ]
+        return list(self._models_list)
     
     def delete_voice_model(self, url: str) -> bool:
         """